@@ -24,6 +24,7 @@
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Relative path from code generators to directory containing the Vulkan XML Registry.
 registry_path = '../../external/Vulkan-Headers/registry'
@@ -73,7 +74,25 @@ if __name__ == '__main__':
     env = os.environ
     env['PYTHONPATH'] = os.pathsep.join(sys.path)
 
-    for target in generate_targets:
-        print('Generating', target)
-        subprocess.call([sys.executable, os.path.join(generator_dir, 'gencode.py'), '-o', current_dir, '-configs', generator_dir, '-registry', os.path.join(registry_dir, 'vk.xml'), target], shell=False, env=env)
+    def generate(target):
+        # Capture the generator output, so that it can be printed without interleaving with the output of the other targets.
+        return subprocess.run([sys.executable, os.path.join(generator_dir, 'gencode.py'), '-o', current_dir, '-configs', generator_dir, '-registry', os.path.join(registry_dir, 'vk.xml'), target], shell=False, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
 
+    # Each target is generated to its own file by a separate gencode.py process, so the targets can be generated concurrently.
+    failed_targets = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = {executor.submit(generate, target): target for target in generate_targets}
+        for result in as_completed(results):
+            target = results[result]
+            process = result.result()
+            if process.returncode == 0:
+                print('Generated', target)
+            else:
+                print('Failed to generate', target)
+                failed_targets.append(target)
+            if process.stdout:
+                print(process.stdout, end='')
+
+    if failed_targets:
+        print('Failed to generate targets:', ', '.join(failed_targets), file=sys.stderr)
+        sys.exit(1)
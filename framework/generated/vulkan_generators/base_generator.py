@@ -68,10 +68,35 @@ _removeExtensions   = ["VK_KHR_video_queue",
 
 # Turn lists of names/patterns into matching regular expressions.
 # From Khronos genvk.py
-_addExtensionsPat     = _makeREstring(_extensions)
-_removeExtensionsPat  = _makeREstring(_removeExtensions)
-_emitExtensionsPat    = _makeREstring(_emitExtensions, '.*')
-_featuresPat          = _makeREstring(_features, '.*')
+# The expressions are compiled once here; the registry passes them to re.compile(), which
+# returns an already compiled pattern unchanged.
+_addExtensionsPat     = re.compile(_makeREstring(_extensions))
+_removeExtensionsPat  = re.compile(_makeREstring(_removeExtensions))
+_emitExtensionsPat    = re.compile(_makeREstring(_emitExtensions, '.*'))
+_featuresPat          = re.compile(_makeREstring(_features, '.*'))
+
+# Feature protect macros for the 'platform' tag on a feature.
+# From Vulkan-ValidationLayers common_codegen.py
+# TODO: This should probably be in a JSON file.
+_platformProtect = {
+    'android' : 'VK_USE_PLATFORM_ANDROID_KHR',
+    'fuchsia' : 'VK_USE_PLATFORM_FUCHSIA',
+    'ios' : 'VK_USE_PLATFORM_IOS_MVK',
+    'macos' : 'VK_USE_PLATFORM_MACOS_MVK',
+    'mir' : 'VK_USE_PLATFORM_MIR_KHR',
+    'vi' : 'VK_USE_PLATFORM_VI_NN',
+    'wayland' : 'VK_USE_PLATFORM_WAYLAND_KHR',
+    'win32' : 'VK_USE_PLATFORM_WIN32_KHR',
+    'xcb' : 'VK_USE_PLATFORM_XCB_KHR',
+    'xlib' : 'VK_USE_PLATFORM_XLIB_KHR',
+    'xlib_xrandr' : 'VK_USE_PLATFORM_XLIB_XRANDR_EXT',
+    'ggp' : 'VK_USE_PLATFORM_GGP',
+    'directfb' : 'VK_USE_PLATFORM_DIRECTFB_EXT',
+    'headless' : 'VK_USE_PLATFORM_HEADLESS'
+}
+
+# Matches the start of each non-empty line in a string, for indenting generated code.
+_nonEmptyLineStart = re.compile(r'^(?=.)', re.MULTILINE)
 
 
 # ValueInfo - Class to store parameter/struct member information.
@@ -90,6 +115,21 @@ _featuresPat          = _makeREstring(_features, '.*')
 #   isDynamic - True if the memory for the member is an array and it is dynamically allocated.
 class ValueInfo():
     """Contains information descripting Vulkan API call parameters and struct members"""
+    # A ValueInfo is created for every parameter and struct member, so avoid the per-instance __dict__.
+    __slots__ = ('name',
+                 'baseType',
+                 'fullType',
+                 'pointerCount',
+                 'arrayLength',
+                 'arrayLengthValue',
+                 'arrayCapacity',
+                 'platformBaseType',
+                 'platformFullType',
+                 'bitfieldWidth',
+                 'isPointer',
+                 'isArray',
+                 'isDynamic')
+
     def __init__(self,
                  name,
                  baseType,
@@ -102,19 +142,33 @@ class ValueInfo():
                  platformFullType = None,
                  bitfieldWidth = None):
         self.name = name
-        self.baseType = baseType
-        self.fullType = fullType
+        # Type names are shared by many values, so intern them to store a single copy of each.
+        self.baseType = sys.intern(baseType)
+        self.fullType = sys.intern(fullType)
         self.pointerCount = pointerCount
         self.arrayLength = arrayLength
         self.arrayLengthValue = None
         self.arrayCapacity = arrayCapacity
-        self.platformBaseType = platformBaseType
+        self.platformBaseType = sys.intern(platformBaseType) if platformBaseType else platformBaseType
         self.platformFullType = platformFullType
         self.bitfieldWidth = bitfieldWidth
 
-        self.isPointer = True if pointerCount > 0 else False
-        self.isArray = True if arrayLength else False
-        self.isDynamic = True if not arrayCapacity else False
+        self.isPointer = pointerCount > 0
+        self.isArray = arrayLength is not None
+        self.isDynamic = arrayCapacity is None
+
+
+# ValueInfoList - List of ValueInfo objects created by BaseGenerator.makeValueInfo.
+#
+# Members:
+#   arrayLengthNames - Set of the arrayLength values of the list's array values.
+class ValueInfoList(list):
+    """List of ValueInfo objects for the parameters of an API call or the members of a struct"""
+    __slots__ = ('arrayLengthNames',)
+
+    def __init__(self, values):
+        list.__init__(self, values)
+        self.arrayLengthNames = {value.arrayLength for value in values if value.arrayLength is not None}
 
 
 # BaseGeneratorOptions - subclass of GeneratorOptions.
@@ -202,18 +256,6 @@ class BaseGeneratorOptions(GeneratorOptions):
 #   components that encode and decode Vulkan API parameters.
 class BaseGenerator(OutputGenerator):
     """Base class for Vulkan API parameter encoding and decoding generators."""
-    # These API calls should not be processed by the code generator.  They require special implementations.
-    APICALL_BLACKLIST = []
-
-    # These structures should not be processed by the code generator.  They require special implementations.
-    STRUCT_BLACKLIST = []
-
-    # Platform specific basic types that have been defined extarnally to the Vulkan header.
-    PLATFORM_TYPES = {}
-
-    # Platform specific structure types that have been defined extarnally to the Vulkan header.
-    PLATFORM_STRUCTS = []
-
     GENERIC_HANDLE_APICALLS = {'vkDebugReportMessageEXT' : {'object' : 'objectType' },
                                'vkSetPrivateDataEXT' : {'objectHandle' : 'objectType' },
                                'vkGetPrivateDataEXT' : {'objectHandle' : 'objectType' }}
@@ -232,6 +274,20 @@ class BaseGenerator(OutputGenerator):
     # Default C++ code indentation size.
     INDENT_SIZE = 4
 
+    # Names used in encoder/decoder function/method names for the C basic types.
+    BASIC_INVOCATION_TYPE_NAMES = {'wchar_t'  : 'WString',
+                                   'char'     : 'String',
+                                   'size_t'   : 'SizeT',
+                                   'int'      : 'Int32',      # Extensions use the int type when dealing with file descriptors
+                                   'int8_t'   : 'Int8',
+                                   'int16_t'  : 'Int16',
+                                   'int32_t'  : 'Int32',
+                                   'int64_t'  : 'Int64',
+                                   'uint8_t'  : 'UInt8',
+                                   'uint16_t' : 'UInt16',
+                                   'uint32_t' : 'UInt32',
+                                   'uint64_t' : 'UInt64'}
+
     def __init__(self,
                  processCmds,
                  processStructs,
@@ -241,11 +297,19 @@ class BaseGenerator(OutputGenerator):
                  diagFile = sys.stdout):
         OutputGenerator.__init__(self, errFile, warnFile, diagFile)
 
+        # These are populated from the JSON configuration files by beginFile, and are per-instance
+        # so that entries loaded by one generator are not inherited by generators created after it.
+        self.APICALL_BLACKLIST = set()                    # API calls that require special implementations and should not be processed by the code generator
+        self.STRUCT_BLACKLIST = set()                     # Structures that require special implementations and should not be processed by the code generator
+        self.PLATFORM_TYPES = dict()                      # Platform specific basic types that have been defined externally to the Vulkan header
+        self.PLATFORM_STRUCTS = set()                     # Platform specific structure types that have been defined externally to the Vulkan header
+
         # Typenames
         self.structNames = set()                          # Set of Vulkan struct typenames
-        self.handleNames = set()                          # Set of Vulkan handle typenames
         self.flagsTypes = dict()                          # Map of flags types to base flag type (VkFlags or VkFlags64)
-        self.enumNames = set()                            # Set of Vulkan enumeration typenames
+        self.typeKinds = dict()                           # Map of struct, handle, flags, and enum typenames to 'struct', 'handle', 'flags', or 'enum'
+        self.invocationTypeNameCache = dict()             # Map of typenames to maps of isHandle() results to results from makeInvocationTypeName
+        self.decodedParamTypeCache = dict()               # Map of typenames to maps of value properties to results from makeDecodedParamType
 
         # Type processing options
         self.processCmds = processCmds                    # Populate the featureCmdParams map
@@ -284,7 +348,7 @@ class BaseGenerator(OutputGenerator):
 
             # Platform defined struct processing must be implemented manually,
             # so these structs will be added to the blacklist.
-            self.STRUCT_BLACKLIST += self.PLATFORM_STRUCTS
+            self.STRUCT_BLACKLIST.update(self.PLATFORM_STRUCTS)
 
         # User-supplied prefix text, if any (list of strings)
         if (genOpts.prefixText):
@@ -293,7 +357,8 @@ class BaseGenerator(OutputGenerator):
 
         # Multiple inclusion protection & C++ wrappers.
         if (genOpts.protectFile and self.genOpts.filename):
-            headerSym = 'GFXRECON_' + re.sub('\.h', '_H', os.path.basename(self.genOpts.filename)).upper()
+            baseName, _ = os.path.splitext(os.path.basename(self.genOpts.filename))
+            headerSym = 'GFXRECON_' + baseName.upper() + '_H'
             write('#ifndef ', headerSym, file=self.outFile)
             write('#define ', headerSym, file=self.outFile)
             self.newline()
@@ -346,17 +411,19 @@ class BaseGenerator(OutputGenerator):
     # Type generation
     def genType(self, typeinfo, name, alias):
         OutputGenerator.genType(self, typeinfo, name, alias)
+        name = sys.intern(name)
         typeElem = typeinfo.elem
         # If the type is a struct type, traverse the imbedded <member> tags
         # generating a structure. Otherwise, emit the tag text.
         category = typeElem.get('category')
         if (category == 'struct' or category == 'union'):
             self.structNames.add(name)
+            self.typeKinds[name] = 'struct'
             # Skip code generation for union encode/decode functions.
             if category == 'struct':
                 self.genStruct(typeinfo, name, alias)
         elif (category == 'handle'):
-            self.handleNames.add(name)
+            self.typeKinds[name] = 'handle'
         elif (category == 'bitmask'):
             # Flags can have either VkFlags or VkFlags64 base type
             alias = typeElem.get('alias')
@@ -366,6 +433,11 @@ class BaseGenerator(OutputGenerator):
             else:
                 # Otherwise, look for base type inside type declaration
                 self.flagsTypes[name] = typeElem.find('type').text
+            self.typeKinds[name] = 'flags'
+
+        # The type may have been reclassified, so discard any previously cached invocation and decoded type names
+        self.invocationTypeNameCache.pop(name, None)
+        self.decodedParamTypeCache.pop(name, None)
 
     #
     # Struct (e.g. C "struct" type) generation.
@@ -388,7 +460,10 @@ class BaseGenerator(OutputGenerator):
     # These are concatenated together with other types.
     def genGroup(self, groupinfo, groupName, alias):
         OutputGenerator.genGroup(self, groupinfo, groupName, alias)
-        self.enumNames.add(groupName)
+        groupName = sys.intern(groupName)
+        self.typeKinds[groupName] = 'enum'
+        self.invocationTypeNameCache.pop(groupName, None)
+        self.decodedParamTypeCache.pop(groupName, None)
 
     # Enumerant generation
     # <enum> tags may specify their values in several ways, but are usually
@@ -424,16 +499,22 @@ class BaseGenerator(OutputGenerator):
     #  params - list of <param> or <member> tags to process
     def makeValueInfo(self, params):
         values = []
-        for param in params:
+
+        # Gather child elements and the set of names for all params up front, as static
+        # array lengths may be specified by a param that follows the array.
+        paramElements = [(param,) + self.__getParamElements(param) for param in params]
+        paramNames = {noneStr(nameElem.text) for _, nameElem, _, _ in paramElements}
+
+        for param, nameElem, typeElem, enumElem in paramElements:
             # Get name
-            elem = param.find('name')
-            name = noneStr(elem.text)
-            nameTail = noneStr(elem.tail)
+            name = noneStr(nameElem.text)
+            nameTail = noneStr(nameElem.tail)
 
             # Get type info
-            elem = param.find('type')
-            baseType = noneStr(elem.text)
-            fullType = (noneStr(param.text) + baseType + noneStr(elem.tail)).strip()
+            baseType = noneStr(typeElem.text)
+            typePrefix = noneStr(param.text)
+            typeSuffix = noneStr(typeElem.tail)
+            fullType = (typePrefix + baseType + typeSuffix).strip()
 
             # Check for platform specific type definitions that need to be converted to a recognized trace format type.
             platformBaseType = None
@@ -442,19 +523,20 @@ class BaseGenerator(OutputGenerator):
                 typeInfo = self.PLATFORM_TYPES[baseType]
                 platformBaseType = baseType
                 platformFullType = fullType
-                fullType = fullType.replace(baseType, typeInfo['replaceWith'])
+                # Build the substituted type from its parts, rather than searching fullType for baseType.
+                fullType = (typePrefix + typeInfo['replaceWith'] + typeSuffix).strip()
                 baseType = typeInfo['baseType']
 
             # Get array length, always use altlen when available to avoid parsing latexmath
             if 'altlen' in param.attrib:
                 arrayLength =  param.attrib.get('altlen')
             else:
-                arrayLength = self.getArrayLen(param)
+                arrayLength = self.__getArrayLen(param, nameElem, enumElem)
 
             arrayCapacity = None
-            if self.isStaticArray(param):
+            if self.__isStaticArray(nameElem):
                 arrayCapacity = arrayLength
-                arrayLength = self.getStaticArrayLen(name, params, arrayCapacity)
+                arrayLength = self.getStaticArrayLen(name, paramNames, arrayCapacity)
 
             # Get bitfield width
             bitfieldWidth = None
@@ -479,53 +561,64 @@ class BaseGenerator(OutputGenerator):
                     arrayValue.arrayLengthValue = v
                     break
 
-        return values
+        return ValueInfoList(values)
+
+    #
+    # Retrieve the <name>, <type>, and <enum> child elements of a <param> or <member> tag
+    # with a single pass over its children.  Missing elements are returned as None.
+    def __getParamElements(self, param):
+        nameElem = None
+        typeElem = None
+        enumElem = None
+        for child in param:
+            tag = child.tag
+            if tag == 'name':
+                if nameElem is None:
+                    nameElem = child
+            elif tag == 'type':
+                if typeElem is None:
+                    typeElem = child
+            elif tag == 'enum':
+                if enumElem is None:
+                    enumElem = child
+        return nameElem, typeElem, enumElem
 
     #
     # Check for struct type
     def isStruct(self, baseType):
-        if (baseType in self.structNames) or (baseType in self.PLATFORM_STRUCTS):
-            return True
-        return False
+        return self.typeKinds.get(baseType) == 'struct'
 
     #
     # Check for handle type
     def isHandle(self, baseType):
-        if baseType in self.handleNames:
-            return True
-        return False
+        return self.typeKinds.get(baseType) == 'handle'
 
     #
     # Check for dispatchable handle type
     def isDispatchableHandle(self, baseType):
-        if baseType in self.DISPATCHABLE_HANDLE_TYPES:
-            return True
-        return False
+        return baseType in self.DISPATCHABLE_HANDLE_TYPES
 
     #
     # Check for enum type
     def isEnum(self, baseType):
-        if baseType in self.enumNames:
-            return True
-        return False
+        return self.typeKinds.get(baseType) == 'enum'
 
     #
     # Check for flags (bitmask) type
     def isFlags(self, baseType):
-        if baseType in self.flagsTypes:
-            return True
-        return False
+        return self.typeKinds.get(baseType) == 'flags'
 
     #
     # Check for function pointer type
     def isFunctionPtr(self, baseType):
-        if baseType[:4] == 'PFN_':
-            return True
-        return False
+        return baseType.startswith('PFN_')
 
     #
     # Determine if the value name specifies an array length
     def isArrayLen(self, name, values):
+        if isinstance(values, ValueInfoList):
+            return name in values.arrayLengthNames
+        # Lists not created by makeValueInfo, such as slices, must be searched.
         for value in values:
             if name == value.arrayLength:
                 return True
@@ -559,6 +652,9 @@ class BaseGenerator(OutputGenerator):
     #
     # Retrieve the length of an array defined by a <param> or <member> element
     def getArrayLen(self, param):
+        return self.__getArrayLen(param, param.find('name'), param.find('enum'))
+
+    def __getArrayLen(self, param, paramname, paramenumsize):
         result = None
         len = param.attrib.get('len')
         if len:
@@ -571,41 +667,35 @@ class BaseGenerator(OutputGenerator):
                     result = len.split(',')[0]
             else:
                 result = len
-            if result:
-                result = str(result).replace('::', '->')
+            if result and ('::' in result):
+                result = result.replace('::', '->')
         else:
             # Check for a static array
-            paramname = param.find('name')
             if (paramname.tail is not None) and ('[' in paramname.tail):
-                paramenumsize = param.find('enum')
                 if paramenumsize is not None:
                     result = paramenumsize.text
                 else:
-                    paramsizes = paramname.tail[1:-1].split('][')
-                    sizetokens = []
-                    for paramsize in paramsizes:
-                        sizetokens.append(paramsize)
-                    result = ', '.join(sizetokens)
+                    result = ', '.join(paramname.tail[1:-1].split(']['))
         return result
 
     #
     # Check for a static array
     def isStaticArray(self, param):
-        name = param.find('name')
-        if (name.tail is not None) and ('[' in name.tail):
-            return True
-        return False
+        return self.__isStaticArray(param.find('name'))
+
+    def __isStaticArray(self, name):
+        return (name.tail is not None) and ('[' in name.tail)
 
     #
     # Determine the length value of a static array (getArrayLen() returns the total capacity, not the actual length)
-    def getStaticArrayLen(self, name, params, capacity):
+    #  paramNames - set of the names of all <param> or <member> tags in the parameter list
+    def getStaticArrayLen(self, name, paramNames, capacity):
         # The XML registry does not provide a direct method for determining if a parameter provides the length
         # of a static array, but the parameter naming follows a pattern of array name = 'values' and length
         # name = 'valueCount'.  We will search the parameter list for a length parameter using this pattern.
         lengthName = name[:-1] + 'Count'
-        for param in params:
-            if lengthName == noneStr(param.find('name').text):
-                return lengthName
+        if lengthName in paramNames:
+            return lengthName
 
         # Not all static arrays have an associated length parameter. These will use capacity as length.
         return capacity
@@ -613,16 +703,12 @@ class BaseGenerator(OutputGenerator):
     #
     # Determines if a struct with the specified typename is blacklisted.
     def isStructBlackListed(self, typename):
-        if typename in self.STRUCT_BLACKLIST:
-            return True
-        return False
+        return typename in self.STRUCT_BLACKLIST
 
     #
     # Determines if a struct with the specified typename is blacklisted.
     def isCmdBlackListed(self, name):
-        if name in self.APICALL_BLACKLIST:
-            return True
-        return False
+        return name in self.APICALL_BLACKLIST
 
     #
     # Retrieves a filtered list of keys from self.featureStructMemebers with blacklisted items removed.
@@ -757,8 +843,7 @@ class BaseGenerator(OutputGenerator):
     #  value - String to indent.
     #  spaces - Number of spaces to indent.
     def indent(self, value, spaces):
-        prefix = ' ' * spaces
-        return '\n'.join([prefix + v if v else v for v in value.split('\n')])
+        return _nonEmptyLineStart.sub(' ' * spaces, value)
 
     #
     # Return a copy of inList with duplicates removed, preserving order
@@ -773,7 +858,7 @@ class BaseGenerator(OutputGenerator):
     # Create a string containing a comma separated argument list from a list of ValueInfo values.
     #  values - List of ValueInfo objects providing the parameter names for the argument list.
     def makeArgList(self, values):
-        return ', '.join([value.name for value in values])
+        return ', '.join(value.name for value in values)
 
     #
     # makeAlignedParamDecl - return an indented parameter declaration string with the parameter
@@ -792,33 +877,33 @@ class BaseGenerator(OutputGenerator):
 
     #
     # Convert a type name to a string to be used as part of an encoder/decoder function/method name.
+    # Results are cached, as the same small set of types is queried for every parameter and struct member.
     def makeInvocationTypeName(self, baseType):
+        # Handles are checked with isHandle(), which some generators override to restrict the match,
+        # so the result is part of the cache key.
+        isHandle = self.isHandle(baseType)
+
+        typeCache = self.invocationTypeNameCache.setdefault(baseType, dict())
+        typeName = typeCache.get(isHandle)
+        if typeName is None:
+            typeName = self.__makeInvocationTypeName(baseType, isHandle)
+            typeCache[isHandle] = typeName
+        return typeName
+
+    def __makeInvocationTypeName(self, baseType, isHandle):
         if self.isStruct(baseType):
             return baseType
-        elif self.isHandle(baseType):
+        elif isHandle:
             return 'Handle'
         elif self.isFlags(baseType):
             # Strip 'Vk' from base flag type
             return self.flagsTypes[baseType][2:]
         elif self.isEnum(baseType):
             return 'Enum'
-        elif baseType == 'wchar_t':
-            return 'WString'
-        elif baseType == 'char':
-            return 'String'
+        elif baseType in self.BASIC_INVOCATION_TYPE_NAMES:
+            return self.BASIC_INVOCATION_TYPE_NAMES[baseType]
         elif self.isFunctionPtr(baseType):
             return 'FunctionPtr'
-        elif baseType == 'size_t':
-            return 'SizeT'
-        elif baseType == 'int':
-            # Extensions use the int type when dealing with file descriptors
-            return 'Int32'
-        elif baseType.endswith('_t'):
-            if baseType[0] == 'u':
-                # For unsigned types, capitalize the first two characters.
-                return baseType[0].upper() + baseType[1].upper() + baseType[2:-2]
-            else:
-                return baseType[:-2].title()
         elif baseType[0].islower():
             return baseType.title()
 
@@ -826,14 +911,29 @@ class BaseGenerator(OutputGenerator):
 
     #
     # Create a type to use for a decoded parameter, using the decoder wrapper types for pointers.
+    # Results are cached by type and by the value properties that determine the decoded type.
     def makeDecodedParamType(self, value):
+        # Handles are checked with isHandle(), which some generators override to restrict the match,
+        # so the result is part of the cache key.
+        isHandle = self.isHandle(value.baseType)
+        key = (value.pointerCount, value.isPointer, value.isArray, isHandle)
+
+        typeCache = self.decodedParamTypeCache.setdefault(value.baseType, dict())
+        typeName = typeCache.get(key)
+        if typeName is None:
+            typeName = self.__makeDecodedParamType(value, isHandle)
+            typeCache[key] = typeName
+        return typeName
+
+    def __makeDecodedParamType(self, value, isHandle):
         typeName = value.baseType
+        isStruct = self.isStruct(typeName)
 
         # isPointer will be False for static arrays.
         if value.isPointer or value.isArray:
             count = value.pointerCount
 
-            if self.isStruct(typeName):
+            if isStruct:
                 if count > 1:
                     typeName = 'StructPointerDecoder<Decoded_{}*>'.format(typeName)
                 else:
@@ -859,7 +959,7 @@ class BaseGenerator(OutputGenerator):
                 else:
                     # If this was a pointer to an unknown object (void*), it was encoded as a 64-bit address value.
                     typeName = 'uint64_t'
-            elif self.isHandle(typeName):
+            elif isHandle:
                 typeName = 'HandlePointerDecoder<{}>'.format(typeName)
             else:
                 if count > 1:
@@ -869,9 +969,9 @@ class BaseGenerator(OutputGenerator):
         elif self.isFunctionPtr(typeName):
             # Function pointers are encoded as a 64-bit address value.
             typeName ='uint64_t'
-        elif self.isStruct(typeName):
+        elif isStruct:
             typeName = 'Decoded_{}'.format(typeName)
-        elif self.isHandle(typeName):
+        elif isHandle:
             typeName = 'format::HandleId'
         else:
             typeName = '{}'.format(typeName)
@@ -882,26 +982,30 @@ class BaseGenerator(OutputGenerator):
     # makeConsumerDecl - return VulkanConsumer class member function declaration
     def makeConsumerFuncDecl(self, returnType, name, values):
         """Generate VulkanConsumer class member function declaration"""
+        indentColumn = self.INDENT_SIZE
+        alignColumn = self.genOpts.alignFuncParam
+
         paramDecls = []
 
         if returnType != 'void':
-            paramDecl = self.makeAlignedParamDecl(returnType, 'returnValue', self.INDENT_SIZE, self.genOpts.alignFuncParam)
-            paramDecls.append(paramDecl)
+            paramDecls.append(self.makeAlignedParamDecl(returnType, 'returnValue', indentColumn, alignColumn))
 
-        for value in values:
-            paramType = self.makeDecodedParamType(value)
-
-            if 'Decoder' in paramType:
-                paramType = '{}*'.format(paramType)
-
-            paramDecl = self.makeAlignedParamDecl(paramType, value.name, self.INDENT_SIZE, self.genOpts.alignFuncParam)
-            paramDecls.append(paramDecl)
+        paramDecls.extend([self.makeAlignedParamDecl(self.__makeConsumerParamType(value), value.name, indentColumn, alignColumn) for value in values])
 
         if paramDecls:
             return 'void {}(\n{})'.format(name, ',\n'.join(paramDecls))
 
         return 'void {}()'.format(name)
 
+    #
+    # Return the decoded parameter type for a VulkanConsumer member function parameter, which
+    # receives the decoder wrapper types by pointer.
+    def __makeConsumerParamType(self, value):
+        paramType = self.makeDecodedParamType(value)
+        if 'Decoder' in paramType:
+            return '{}*'.format(paramType)
+        return paramType
+
     #
     # Generate the VkStructreType enumeration value for the specified structure type
     def makeStructureTypeEnum(self, typeinfo, typename):
@@ -1030,36 +1134,17 @@ class BaseGenerator(OutputGenerator):
     # Return appropriate feature protect string from 'platform' tag on feature.
     # From Vulkan-ValidationLayers common_codegen.py
     def __getFeatureProtect(self, interface):
-        # TODO: This should probably be in a JSON file.
-        platform_dict = {
-            'android' : 'VK_USE_PLATFORM_ANDROID_KHR',
-            'fuchsia' : 'VK_USE_PLATFORM_FUCHSIA',
-            'ios' : 'VK_USE_PLATFORM_IOS_MVK',
-            'macos' : 'VK_USE_PLATFORM_MACOS_MVK',
-            'mir' : 'VK_USE_PLATFORM_MIR_KHR',
-            'vi' : 'VK_USE_PLATFORM_VI_NN',
-            'wayland' : 'VK_USE_PLATFORM_WAYLAND_KHR',
-            'win32' : 'VK_USE_PLATFORM_WIN32_KHR',
-            'xcb' : 'VK_USE_PLATFORM_XCB_KHR',
-            'xlib' : 'VK_USE_PLATFORM_XLIB_KHR',
-            'xlib_xrandr' : 'VK_USE_PLATFORM_XLIB_XRANDR_EXT',
-            'ggp' : 'VK_USE_PLATFORM_GGP',
-            'directfb' : 'VK_USE_PLATFORM_DIRECTFB_EXT',
-            'headless' : 'VK_USE_PLATFORM_HEADLESS'
-        }
-
-        platform = interface.get('platform')
-        if platform and platform in platform_dict:
-            return platform_dict[platform]
-        return None
+        return _platformProtect.get(interface.get('platform'))
 
     def __loadBlacklists(self, filename):
-        lists = json.loads(open(filename, 'r').read())
-        self.APICALL_BLACKLIST += lists['functions']
-        self.STRUCT_BLACKLIST += lists['structures']
+        with open(filename, 'r') as f:
+            lists = json.load(f)
+        self.APICALL_BLACKLIST.update(lists['functions'])
+        self.STRUCT_BLACKLIST.update(lists['structures'])
 
     def __loadPlatformTypes(self, filename):
-        platforms = json.loads(open(filename, 'r').read())
+        with open(filename, 'r') as f:
+            platforms = json.load(f)
         for platform_name in platforms:
             platform = platforms[platform_name]
             platform_types = platform['types']
@@ -1069,4 +1154,6 @@ class BaseGenerator(OutputGenerator):
 
             platform_structs = platform['structs']
             if platform_structs:
-                self.PLATFORM_STRUCTS += platform_structs
+                self.PLATFORM_STRUCTS.update(platform_structs)
+                for struct in platform_structs:
+                    self.typeKinds[struct] = 'struct'
@@ -52,7 +52,7 @@ class LayerFuncTableGenerator(BaseGenerator):
                                errFile=errFile, warnFile=warnFile, diagFile=diagFile)
 
         # The trace layer does not currently implement or export the instance version query
-        self.APICALL_BLACKLIST = ['vkEnumerateInstanceVersion']
+        self.APICALL_BLACKLIST = {'vkEnumerateInstanceVersion'}
 
         # These functions are provided directly by the layer, and are not encoded
         self.LAYER_FUNCTIONS = ['vkGetInstanceProcAddr',
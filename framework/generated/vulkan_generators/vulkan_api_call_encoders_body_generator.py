@@ -533,5 +533,6 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
         return False
 
     def __loadCaptureOverrides(self, filename):
-        overrides = json.loads(open(filename, 'r').read())
+        with open(filename, 'r') as f:
+            overrides = json.load(f)
         self.CAPTURE_OVERRIDES = overrides['functions']
@@ -508,5 +508,6 @@ class VulkanReplayConsumerBodyGenerator(BaseGenerator):
         return expr
 
     def __loadReplayOverrides(self, filename):
-        overrides = json.loads(open(filename, 'r').read())
+        with open(filename, 'r') as f:
+            overrides = json.load(f)
         self.REPLAY_OVERRIDES = overrides['functions']